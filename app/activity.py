@@ -3,18 +3,22 @@ This module defines the PostgreSQL activity manager. The activity manager is
 used to get the activity information from PostgreSQL.
 """
 
+import asyncio
 import collections
 import dataclasses
 import datetime
 import logging
+import operator
+import time
 from typing import (
+	Any,
+	Dict,
 	List,
 	NamedTuple,
-	Optional,
-	Tuple)
+	Optional)
 
-import aiopg
-import psycopg2.extras
+import psycopg
+import psycopg_pool
 
 ACTIVITY_HEADER = collections.OrderedDict([
 	('pid', "PID"),
@@ -35,16 +39,116 @@ ACTIVITY_HEADER = collections.OrderedDict([
 Maps activity field name (:class:`str`) to header name (:class:`str`).
 """
 
+_ACTIVITY_CACHE_TTL = 0.25
+"""
+The time (in seconds) that a fetched activity snapshot is reused for.
+"""
+
+_ACTIVITY_COLUMNS = {
+	'application_name': "application_name",
+	'backend_start': "backend_start",
+	'client_addr': "host(client_addr)",
+	'client_hostname': "client_hostname",
+	'client_port': "client_port",
+	'datname': "datname",
+	'pid': "pid",
+	'query_start': "query_start",
+	'state': "state",
+	'state_change': "state_change",
+	'usename': "usename",
+	'wait_event': "wait_event",
+	'xact_start': "xact_start",
+}
+"""
+Maps activity field name (:class:`str`) to the SQL expression (:class:`str`)
+used to select it from ``pg_stat_activity`` for PostgreSQL 9.6 and above.
+"""
+
+_ACTIVITY_COLUMNS_LT_92 = {
+	'pid': "procpid",
+	'state': """(CASE
+		WHEN current_query = '<IDLE>'
+			THEN 'idle'
+		WHEN current_query = '<IDLE> in transaction'
+			THEN 'idle in transaction'
+		WHEN current_query = '<IDLE> in transaction (aborted)'
+			THEN 'idle in transaction (aborted)'
+		ELSE
+			(CASE WHEN current_query LIKE '<IDLE>%%'
+				THEN current_query
+				ELSE 'active'
+			END)
+	END)""",
+	'state_change': "NULL::text",
+}
+"""
+Maps activity field name (:class:`str`) to the SQL expression (:class:`str`)
+overriding :data:`_ACTIVITY_COLUMNS` for PostgreSQL 9.1 and below.
+"""
+
+_ACTIVITY_COLUMNS_LT_96 = {
+	'wait_event': "(CASE WHEN waiting THEN 'Waiting' END)",
+}
+"""
+Maps activity field name (:class:`str`) to the SQL expression (:class:`str`)
+overriding :data:`_ACTIVITY_COLUMNS` for PostgreSQL 9.5 and below.
+"""
+
 _APP_NAME = "PostgreSQL Activity"
 """
 The application name to use when connecting to PostgreSQL.
 """
 
+_CONNECT_TIMEOUT = 5
+"""
+The time (in seconds) to wait for a connection to be established.
+"""
+
+_get_backend_start = operator.attrgetter('backend_start')
+"""
+Gets the backend start from an :class:`ActivityRow`.
+"""
+
+_get_row_values = operator.itemgetter(slice(0, -1))
+"""
+Gets the activity values from a limited fetch activity row, without the
+trailing total row count.
+"""
+
+_KEEPALIVES_COUNT = 3
+"""
+The number of unacknowledged TCP keepalives before the connection is considered
+dead.
+"""
+
+_KEEPALIVES_IDLE = 30
+"""
+The idle time (in seconds) before a TCP keepalive is sent.
+"""
+
+_KEEPALIVES_INTERVAL = 5
+"""
+The time (in seconds) between unacknowledged TCP keepalives.
+"""
+
 LOG = logging.getLogger(__name__)
 """
 The module logger.
 """
 
+_POOL_MAX_SIZE = 4
+"""
+The maximum number of connections in each connection pool. Each manager holds
+one connection for fetching the activity, and borrows others for the queries
+which should not wait behind it.
+"""
+
+_POOLS: Dict['PostgresConnectionParams', psycopg_pool.AsyncConnectionPool] = {}
+"""
+Maps connection parameters (:class:`PostgresConnectionParams`) to connection
+pool (:class:`psycopg_pool.AsyncConnectionPool`).
+"""
+
 
 class PostgresActivityManager(object):
 	"""
@@ -52,18 +156,74 @@ class PostgresActivityManager(object):
 	PostgreSQL and monitor the database activity.
 	"""
 
-	def __init__(self, params: 'PostgresConnectionParams') -> None:
+	def __init__(
+		self,
+		params: 'PostgresConnectionParams',
+		show_idle: bool = True,
+	) -> None:
 		"""
 		Initializes the :class:`PostgresActivityManager` instance.
 
 		*params* (:class:`PostgresConnectionParams`) contains the PostgreSQL
 		connection parameters.
+
+		*show_idle* (:class:`bool`) is whether idle backends should be fetched
+		(:data:`True`), or not (:data:`False`). Default is :data:`True`.
 		"""
 
-		self.__connection: Optional[aiopg.Connection] = None
+		self.__activity_fetch: Optional[asyncio.Task] = None
 		"""
-		*__connection* (:class:`aiopg.Connection` or :data:`None`) is the PostgreSQL
-		connection.
+		*__activity_fetch* (:class:`asyncio.Task` or :data:`None`) is the active
+		fetch activity task which is shared by concurrent callers.
+		"""
+
+		self.__activity_fetch_key: Optional[_ActivityKey] = None
+		"""
+		*__activity_fetch_key* (:class:`_ActivityKey` or :data:`None`) contains the
+		fetch parameters of the active fetch activity task.
+		"""
+
+		self.__activity_snapshot: Optional[_ActivitySnapshot] = None
+		"""
+		*__activity_snapshot* (:class:`_ActivitySnapshot` or :data:`None`) is the
+		last fetched activity.
+		"""
+
+		self.__connection: Optional[psycopg.AsyncConnection] = None
+		"""
+		*__connection* (:class:`psycopg.AsyncConnection` or :data:`None`) is the
+		PostgreSQL connection.
+		"""
+
+		self.__cursor: Optional[psycopg.AsyncCursor] = None
+		"""
+		*__cursor* (:class:`psycopg.AsyncCursor` or :data:`None`) is the cursor
+		reused for every query on the connection.
+		"""
+
+		self.__cursor_lock = asyncio.Lock()
+		"""
+		*__cursor_lock* (:class:`asyncio.Lock`) serializes the use of the shared
+		cursor.
+		"""
+
+		self.__fetch_activity_sql: Dict[bool, str] = {}
+		"""
+		*__fetch_activity_sql* (:class:`dict`) maps whether the rows are limited
+		(:class:`bool`) to the fetch activity query (:class:`str`) for the
+		PostgreSQL version.
+		"""
+
+		self.__fetch_query_sql: Optional[str] = None
+		"""
+		*__fetch_query_sql* (:class:`str` or :data:`None`) is the fetch "query" query
+		for the PostgreSQL version.
+		"""
+
+		self.__pool: Optional[psycopg_pool.AsyncConnectionPool] = None
+		"""
+		*__pool* (:class:`psycopg_pool.AsyncConnectionPool` or :data:`None`) is the
+		connection pool the connection was acquired from.
 		"""
 
 		self.params: PostgresConnectionParams = params
@@ -72,10 +232,16 @@ class PostgresActivityManager(object):
 		connection parameters.
 		"""
 
-		self.__version: Optional[Tuple[int, ...]] = None
+		self.show_idle: bool = show_idle
+		"""
+		*show_idle* (:class:`bool`) is whether idle backends should be fetched
+		(:data:`True`), or filtered out by PostgreSQL (:data:`False`).
+		"""
+
+		self.__version_num: Optional[int] = None
 		"""
-		*__version* (:class:`tuple` of :class:`int`) is the version of the
-		PostgreSQL database.
+		*__version_num* (:class:`int` or :data:`None`) is the version number of the
+		PostgreSQL database (e.g., 90600 for 9.6).
 		"""
 
 	async def cancel_backend(self, pid: int) -> bool:
@@ -84,160 +250,228 @@ class PostgresActivityManager(object):
 
 		*pid* (:class:`int`) is the PID of the backend process.
 
-		Returns whether the process was terminated (:class:`True`), or not
+		Returns whether the process was canceled (:class:`True`), or not
 		(:class:`False`).
 		"""
-		LOG.debug(f"Cancel backend {pid}.")
-		async with self.__connection.cursor() as cursor:
-			await cursor.execute("""
-				SELECT pg_cancel_backend(%(pid)s) AS success;
-			""", {'pid': pid})
-			row: _CancelBackendRow = await cursor.fetchone()
-			return row.success
+		return (await self.cancel_backends([pid]))[0]
+
+	async def cancel_backends(self, pids: List[int]) -> List[bool]:
+		"""
+		Cancel the backend processes in a single roundtrip.
+
+		*pids* (:class:`list` of :class:`int`) contains the PIDs of the backend
+		processes.
+
+		Returns whether each process was canceled (:class:`list` of
+		:class:`bool`).
+		"""
+		LOG.debug("Cancel backends %s.", pids)
+		rows = await self.__fetch_all_pooled("""
+			SELECT pg_cancel_backend(pid) AS success
+			FROM unnest(%(pids)s::integer[]) AS pid;
+		""", {'pids': pids})
+
+		return [__row[0] for __row in rows]
 
 	async def close(self) -> None:
 		"""
-		Disconnect from PostgreSQL.
+		Disconnect from PostgreSQL. The connection is released back to its pool.
 		"""
 		LOG.debug("Close.")
-		conn, self.__connection = self.__connection, None
-		if conn is not None:
-			await conn.close()
+		self.__activity_snapshot = None
+		task, self.__activity_fetch = self.__activity_fetch, None
+		if task is not None:
+			task.cancel()
+
+			# Wait for the canceled fetch to finish so that it is no longer using the
+			# connection.
+			try:
+				await task
+			except asyncio.CancelledError:
+				pass
+			except Exception:
+				LOG.debug("Canceled fetch failed.", exc_info=True)
+
+		# NOTICE: Hold the cursor lock so that the connection is not released while
+		# a fetch is still using the cursor.
+		async with self.__cursor_lock:
+			conn, self.__connection = self.__connection, None
+			cursor, self.__cursor = self.__cursor, None
+			if cursor is not None:
+				await cursor.close()
+
+			pool, self.__pool = self.__pool, None
+			if conn is not None:
+				if pool is not None:
+					await pool.putconn(conn)
+				else:
+					await conn.close()
+
+	@staticmethod
+	async def close_pools() -> None:
+		"""
+		Close all of the connection pools. This should be called when the
+		application is about to quit.
+		"""
+		LOG.debug("Close pools.")
+		pools = list(_POOLS.values())
+		_POOLS.clear()
+		for pool in pools:
+			await pool.close()
 
 	async def connect(self) -> None:
 		"""
-		Connect to PostgreSQL.
+		Connect to PostgreSQL. The connection is acquired from the pool for the
+		connection parameters so that reconnecting to the same server does not
+		repeat the connection handshake.
 		"""
 		LOG.debug("Connect.")
 		if self.__connection is not None:
 			await self.close()
 
 		# Connect to PostgreSQL.
-		self.__connection = await aiopg.connect(
-			application_name=_APP_NAME,
-			cursor_factory=psycopg2.extras.NamedTupleCursor,
-			database=self.params.database,
-			host=self.params.host,
-			password=self.params.password,
-			port=self.params.port,
-			user=self.params.user,
-		)
-
-		# Get PostgreSQL version.
-		self.__version = await self.__get_version()
+		pool = self.__pool = await self.__get_pool()
+		try:
+			self.__connection = await pool.getconn(timeout=_CONNECT_TIMEOUT)
+		except psycopg_pool.PoolTimeout:
+			await self.__raise_connect_error()
+			raise
+
+		self.__cursor = self.__connection.cursor()
+
+		# Get PostgreSQL version, and build the version specific queries. The
+		# version is reported by the server during the handshake.
+		self.__version_num = self.__connection.info.server_version
+		LOG.debug("VERSION: %s", self.__version_num)
+		self.__fetch_activity_sql = {}
+		if self.__version_num >= 90200:
+			self.__fetch_query_sql = self.__get_fetch_query_ge_92_sql()
+		else:
+			self.__fetch_query_sql = self.__get_fetch_query_le_91_sql()
 
-	async def fetch_activity(self) -> List['ActivityRow']:
+	async def fetch_activity(
+		self,
+		limit: Optional[int] = None,
+	) -> 'ActivityResult':
 		"""
-		Fetch the current activity from PostgreSQL.
+		Fetch the current activity from PostgreSQL. The monitoring connection is
+		always excluded, and idle backends are excluded unless :attr:`show_idle` is
+		set. Concurrent calls share a single fetch, and a snapshot younger than
+		:data:`_ACTIVITY_CACHE_TTL` is reused.
 
-		Returns a the activity (:class:`list` of :class:`ActivityRow`).
-		"""
-		LOG.debug("Fetch activity.")
-		if self.__version >= (9, 6):
-			return await self.__fetch_activity_ge_96()
-		elif self.__version >= (9, 2):
-			return await self.__fetch_activity_ge_92()
-		else:
-			return await self.__fetch_activity_le_91()
+		*limit* (:class:`int` or :data:`None`) is the maximum number of rows to
+		fetch. The oldest backends are kept. Default is :data:`None` to fetch all
+		rows.
 
-	async def __fetch_activity_ge_92(self) -> List['ActivityRow']:
+		Returns the activity result (:class:`ActivityResult`).
 		"""
-		Run the fetch activity query for PostgreSQL 9.2 and above.
+		LOG.debug("Fetch activity.")
+		key = _ActivityKey(limit=limit, show_idle=self.show_idle)
+
+		# Reuse the last snapshot if it is recent enough.
+		snapshot = self.__activity_snapshot
+		if (
+			snapshot is not None
+			and snapshot.key == key
+			and time.monotonic() - snapshot.time < _ACTIVITY_CACHE_TTL
+		):
+			LOG.debug("Fetch activity cached.")
+			return ActivityResult(
+				activity=list(snapshot.activity), total=snapshot.total,
+			)
+
+		# Share the active fetch.
+		task = self.__activity_fetch
+		if task is None or task.done() or self.__activity_fetch_key != key:
+			task = asyncio.create_task(self.__fetch_activity(key))
+			self.__activity_fetch = task
+			self.__activity_fetch_key = key
+
+		# NOTICE: Shield the shared task so that one caller being canceled does not
+		# cancel the fetch for the others.
+		snapshot = await asyncio.shield(task)
+		return ActivityResult(
+			activity=list(snapshot.activity), total=snapshot.total,
+		)
 
-		Returns the activity (:class:`list` of :class:`ActivityRow`).
-		"""
-		LOG.debug("Fetch activity (v>=9.2).")
-		async with self.__connection.cursor() as cursor:
-			await cursor.execute("""
-				SELECT
-					application_name,
-					backend_start,
-					client_addr,
-					nullif(client_hostname, '') AS client_hostname,
-					client_port,
-					datname,
-					pid,
-					query_start,
-					state,
-					state_change,
-					usename,
-					(CASE WHEN waiting
-						THEN 'Waiting'
-					END) AS wait_event,
-					xact_start
-				FROM pg_stat_activity
-				ORDER BY backend_start ASC;
-			""")
-			return await cursor.fetchall()
+	async def __fetch_activity(self, key: '_ActivityKey') -> '_ActivitySnapshot':
+		"""
+		Run the fetch activity query. The query is prepared by the server, and the
+		results are transferred in the binary format.
+
+		*key* (:class:`_ActivityKey`) contains the fetch parameters.
+
+		Returns the activity snapshot (:class:`_ActivitySnapshot`).
+		"""
+		limited = key.limit is not None
+		sql = self.__fetch_activity_sql.get(limited)
+		if sql is None:
+			sql = self.__fetch_activity_sql[limited] = (
+				self.__get_fetch_activity_sql(limited)
+			)
+
+		activity: List[ActivityRow] = []
+		total = 0
+		async with self.__cursor_lock:
+			await self.__cursor.execute(
+				sql,
+				{
+					'limit': key.limit,
+					'show_idle': key.show_idle,
+				},
+				binary=True,
+				prepare=True,
+			)
+
+			# NOTICE: Build the activity rows while iterating over the results instead
+			# of fetching all of the result tuples into an intermediate list.
+			async for values in self.__cursor:
+				if limited:
+					# The limited query appends the total row count to each row.
+					total = values[-1]
+					values = _get_row_values(values)
+
+				row = ActivityRow._make(values)
+
+				# Normalize empty client hostnames to null here rather than in
+				# PostgreSQL.
+				if row.client_hostname == "":
+					row = row._replace(client_hostname=None)
+
+				activity.append(row)
+
+		if not limited:
+			# Sort the rows by backend start here rather than in PostgreSQL. The
+			# limited query has to sort in PostgreSQL to keep the oldest backends.
+			total = len(activity)
+			activity.sort(key=_get_backend_start)
+
+		snapshot = _ActivitySnapshot(
+			activity=activity,
+			key=key,
+			time=time.monotonic(),
+			total=total,
+		)
+		self.__activity_snapshot = snapshot
+		return snapshot
 
-	async def __fetch_activity_ge_96(self) -> List['ActivityRow']:
+	async def __fetch_all_pooled(
+		self,
+		sql: str,
+		params: Dict[str, Any],
+	) -> List[tuple]:
 		"""
-		Run the fetch activity query for PostgreSQL 9.6 and above.
+		Run the query on a separate connection borrowed from the pool. This lets the
+		query run while an activity fetch is in progress on the main connection.
 
-		Returns the activity (:class:`list` of :class:`ActivityRow`).
-		"""
-		LOG.debug("Fetch activity (v>=9.6).")
-		async with self.__connection.cursor() as cursor:
-			await cursor.execute("""
-				SELECT
-					application_name,
-					backend_start,
-					client_addr,
-					nullif(client_hostname, '') AS client_hostname,
-					client_port,
-					datname,
-					pid,
-					query_start,
-					state,
-					state_change,
-					usename,
-					wait_event,
-					xact_start
-				FROM pg_stat_activity
-				ORDER BY backend_start ASC;
-			""")
-			return await cursor.fetchall()
+		*sql* (:class:`str`) is the query.
 
-	async def __fetch_activity_le_91(self) -> List['ActivityRow']:
-		"""
-		Run the fetch activity query for PostgreSQL 9.1 and below.
+		*params* (:class:`dict`) contains the query parameters.
 
-		Returns the activity (:class:`list` of :class:`ActivityRow`).
+		Returns the rows (:class:`list` of :class:`tuple`).
 		"""
-		LOG.debug("Fetch activity (v<=9.1).")
-		async with self.__connection.cursor() as cursor:
-			await cursor.execute("""
-				SELECT
-					application_name,
-					backend_start,
-					client_addr,
-					client_hostname,
-					client_port,
-					datname,
-					procpid AS pid,
-					query_start,
-					(CASE
-						WHEN current_query = '<IDLE>'
-							THEN 'idle'
-						WHEN current_query = '<IDLE> in transaction'
-							THEN 'idle in transaction'
-						WHEN current_query = '<IDLE> in transaction (aborted)'
-							THEN 'idle in transaction (aborted)'
-						ELSE
-							(CASE WHEN current_query LIKE '<IDLE>%'
-								THEN current_query
-								ELSE 'active'
-							END)
-					END) AS state,
-					NULL::text AS state_change,
-					usename,
-					(CASE WHEN waiting
-						THEN 'Waiting'
-					END) AS wait_event,
-					xact_start
-				FROM pg_stat_activity
-				ORDER BY backend_start ASC;
-			""")
+		async with self.__pool.connection(timeout=_CONNECT_TIMEOUT) as conn:
+			cursor = await conn.execute(sql, params, prepare=True)
 			return await cursor.fetchall()
 
 	async def fetch_query(self, pid: int) -> Optional[str]:
@@ -248,73 +482,150 @@ class PostgresActivityManager(object):
 
 		Returns the query (:class:`str` or :data:`None`).
 		"""
-		LOG.debug(f"Fetch query {pid}.")
-		if self.__version >= (9, 2):
-			return await self.__fetch_query_ge_92(pid)
-		else:
-			return await self.__fetch_query_le_91(pid)
+		LOG.debug("Fetch query %s.", pid)
+		rows = await self.__fetch_all_pooled(self.__fetch_query_sql, {'pid': pid})
+		return rows[0][0] if rows else None
+
+	def __get_connect_kwargs(self) -> Dict[str, Any]:
+		"""
+		Get the connection arguments for the connection parameters.
+
+		Returns the connection arguments (:class:`dict`).
+		"""
+		return {
+			'application_name': _APP_NAME,
+			# NOTICE: Autocommit is required so that each refresh sees a new snapshot
+			# of the statistics.
+			'autocommit': True,
+			'connect_timeout': _CONNECT_TIMEOUT,
+			'dbname': self.params.database,
+			'host': self.params.host,
+			'keepalives': 1,
+			'keepalives_count': _KEEPALIVES_COUNT,
+			'keepalives_idle': _KEEPALIVES_IDLE,
+			'keepalives_interval': _KEEPALIVES_INTERVAL,
+			'password': self.params.password,
+			'port': self.params.port,
+			'user': self.params.user,
+		}
+
+	def __get_fetch_activity_sql(self, limited: bool) -> str:
+		"""
+		Get the fetch activity query. The query is generated from the column
+		expressions for the PostgreSQL version.
+
+		*limited* (:class:`bool`) is whether the rows are limited (:data:`True`),
+		or not (:data:`False`). A limited query sorts the rows by backend start,
+		limits them to the ``limit`` parameter, and appends the total row count to
+		each row.
+
+		Returns the query (:class:`str`).
+		"""
+		columns = _ACTIVITY_COLUMNS.copy()
+		if self.__version_num < 90600:
+			columns.update(_ACTIVITY_COLUMNS_LT_96)
+		if self.__version_num < 90200:
+			columns.update(_ACTIVITY_COLUMNS_LT_92)
+
+		select = ",\n".join(
+			f"{columns[__field]} AS {__field}"
+			for __field in ActivityRow._fields
+		)
+		if not limited:
+			return f"""
+				SELECT
+					{select}
+				FROM pg_stat_activity
+				WHERE {columns['pid']} <> pg_backend_pid()
+					AND (%(show_idle)s OR {columns['state']} IS DISTINCT FROM 'idle');
+			"""
 
-	async def __fetch_query_ge_92(self, pid: int) -> Optional[str]:
+		return f"""
+			SELECT
+				{select},
+				count(*) OVER () AS total
+			FROM pg_stat_activity
+			WHERE {columns['pid']} <> pg_backend_pid()
+				AND (%(show_idle)s OR {columns['state']} IS DISTINCT FROM 'idle')
+			ORDER BY {columns['backend_start']}
+			LIMIT %(limit)s;
 		"""
-		Run the fetch "query" query for PostgreSQL 9.2 and above.
 
-		*pid* (:class:`int`) is the PID of the backend process.
+	def __get_fetch_query_ge_92_sql(self) -> str:
+		"""
+		Get the fetch "query" query for PostgreSQL 9.2 and above.
 
-		Returns the query (:class:`str` or :data:`None`).
+		Returns the query (:class:`str`).
+		"""
+		return """
+			SELECT
+				(CASE WHEN state = 'active'
+					THEN query
+					ELSE NULL
+				END) AS query
+			FROM pg_stat_activity
+			WHERE pid = %(pid)s;
 		"""
-		LOG.debug(f"Fetch query {pid} (v>=9.2).")
-		async with self.__connection.cursor() as cursor:
-			await cursor.execute("""
-				SELECT
-					(CASE WHEN state = 'active'
-						THEN query
-						ELSE NULL
-					END) AS query
-				FROM pg_stat_activity
-				WHERE pid = %(pid)s;
-			""", {'pid': pid})
-			row: _FetchQueryRow = await cursor.fetchone()
-			return row.query
 
-	async def __fetch_query_le_91(self, pid: int) -> Optional[str]:
+	def __get_fetch_query_le_91_sql(self) -> str:
 		"""
-		Run the fetch "query" query for PostgreSQL 9.1 and below.
+		Get the fetch "query" query for PostgreSQL 9.1 and below.
 
-		*pid* (:class:`int`) is the PID of the backend process.
+		Returns the query (:class:`str`).
+		"""
+		return """
+			SELECT
+				(CASE WHEN current_query LIKE '<IDLE>%%'
+					THEN NULL
+					ELSE current_query
+				END) AS query
+			FROM pg_stat_activity
+			WHERE procpid = %(pid)s;
+		"""
 
-		Returns the query (:class:`str` or :data:`None`).
+	async def __get_pool(self) -> psycopg_pool.AsyncConnectionPool:
 		"""
-		LOG.debug(f"Fetch query {pid} (v<=9.1).")
-		async with self.__connection.cursor() as cursor:
-			await cursor.execute("""
-				SELECT
-					(CASE WHEN current_query LIKE '<IDLE>%'
-						THEN NULL
-						ELSE current_query
-					END) AS query
-				FROM pg_stat_activity
-				WHERE procpid = %(pid)s;
-			""", {'pid': pid})
-			row: _FetchQueryRow = await cursor.fetchone()
-			return row.query
+		Get the connection pool for the connection parameters, creating it if it
+		does not exist.
 
-	async def __get_version(self) -> Tuple[int, ...]:
+		Returns the pool (:class:`psycopg_pool.AsyncConnectionPool`).
 		"""
-		Run the get version query.
+		pool = _POOLS.get(self.params)
+		if pool is None or pool.closed:
+			LOG.debug("Create pool.")
+			# NOTICE: Check each connection before handing it out so that a connection
+			# lost to a server restart or network drop is replaced.
+			pool = psycopg_pool.AsyncConnectionPool(
+				check=psycopg_pool.AsyncConnectionPool.check_connection,
+				kwargs=self.__get_connect_kwargs(),
+				max_size=_POOL_MAX_SIZE,
+				min_size=1,
+				open=False,
+			)
+			try:
+				await pool.open(wait=True, timeout=_CONNECT_TIMEOUT)
+			except psycopg_pool.PoolTimeout:
+				await pool.close()
+				await self.__raise_connect_error()
+				raise
+			except BaseException:
+				await pool.close()
+				raise
 
-		Returns the version of the PostgreSQL version (:class:`tuple` of
-		:class:`int`).
+			# Only cache the pool once it opened successfully.
+			_POOLS[self.params] = pool
+
+		return pool
+
+	async def __raise_connect_error(self) -> None:
+		"""
+		Connect directly to PostgreSQL to raise the actual error after the pool
+		failed to connect. The pool retries failed connections in the background
+		and only logs their cause. This returns if the direct connection succeeds.
 		"""
-		LOG.debug("Get version.")
-		async with self.__connection.cursor() as cursor:
-			await cursor.execute("""
-				SHOW server_version;
-			""")
-			row: _GetVersionRow = await cursor.fetchone()
-			LOG.debug(f"VERSION: {row.server_version}")
-			version_parts = row.server_version.split(" ", 1)[0].split(".", 2)[:2]
-			version = tuple(map(int, version_parts))
-			return version
+		LOG.debug("Probe connection.")
+		conn = await psycopg.AsyncConnection.connect(**self.__get_connect_kwargs())
+		await conn.close()
 
 	async def terminate_backend(self, pid: int) -> bool:
 		"""
@@ -325,13 +636,25 @@ class PostgresActivityManager(object):
 		Returns whether the process was terminated (:class:`True`), or not
 		(:class:`False`).
 		"""
-		LOG.debug(f"Terminate backend {pid}.")
-		async with self.__connection.cursor() as cursor:
-			await cursor.execute("""
-				SELECT pg_terminate_backend(%(pid)s) AS success;
-			""", {'pid': pid})
-			row: _TerminateBackendRow = await cursor.fetchone()
-			return row.success
+		return (await self.terminate_backends([pid]))[0]
+
+	async def terminate_backends(self, pids: List[int]) -> List[bool]:
+		"""
+		Terminate the backend processes in a single roundtrip.
+
+		*pids* (:class:`list` of :class:`int`) contains the PIDs of the backend
+		processes.
+
+		Returns whether each process was terminated (:class:`list` of
+		:class:`bool`).
+		"""
+		LOG.debug("Terminate backends %s.", pids)
+		rows = await self.__fetch_all_pooled("""
+			SELECT pg_terminate_backend(pid) AS success
+			FROM unnest(%(pids)s::integer[]) AS pid;
+		""", {'pids': pids})
+
+		return [__row[0] for __row in rows]
 
 
 class ActivityRow(NamedTuple):
@@ -350,16 +673,21 @@ class ActivityRow(NamedTuple):
 	xact_start: Optional[datetime.datetime]
 
 
-class _CancelBackendRow(NamedTuple):
-	success: bool
+class ActivityResult(NamedTuple):
+	activity: List[ActivityRow]
+	total: int
 
 
-class _FetchQueryRow(NamedTuple):
-	query: Optional[str]
+class _ActivityKey(NamedTuple):
+	limit: Optional[int]
+	show_idle: bool
 
 
-class _GetVersionRow(NamedTuple):
-	server_version: str
+class _ActivitySnapshot(NamedTuple):
+	activity: List[ActivityRow]
+	key: _ActivityKey
+	time: float
+	total: int
 
 
 @dataclasses.dataclass(frozen=True)
@@ -370,6 +698,3 @@ class PostgresConnectionParams(object):
 	port: int
 	user: str
 
-
-class _TerminateBackendRow(NamedTuple):
-	success: bool
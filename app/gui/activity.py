@@ -4,71 +4,75 @@ This module defines the activity window.
 
 import asyncio
 import datetime
-import importlib.resources
 import logging
+import operator
 from typing import (
+	AbstractSet,
 	Any,
+	Callable,
+	Dict,
 	List,
 	Optional,
+	Tuple,
 	Union,
 	cast)
 
 from PySide6.QtCore import (
 	QAbstractTableModel,
 	QItemSelection,
+	QItemSelectionModel,
 	QModelIndex,
 	QObject,
-	QSortFilterProxyModel,
+	QSignalBlocker,
 	Qt,
 	SignalInstance)
 from PySide6.QtGui import (
 	QAction)
 from PySide6.QtWidgets import (
 	QApplication,
+	QHeaderView,
 	QMainWindow,
+	QMessageBox,
 	QStatusBar,
 	QTableView,
 	QTextEdit)
-from PySide6.QtUiTools import (
-	QUiLoader)
 from qasync import (
 	asyncClose,
 	asyncSlot)
 
-import app.gui
 from app.activity import (
 	ACTIVITY_HEADER,
+	ActivityResult,
 	ActivityRow,
 	PostgresActivityManager)
+from .activity_ui import (
+	Ui_MainWindow)
 from .connect import (
 	ConnectDialogController)
-from .util import (
-	ObjectSel,
-	find_child)
 
-_ACTION_CANCEL_BACKEND = ObjectSel(QAction, "action_CancelBackend")
+_COLUMN_FIELDS: Tuple[str, ...] = ActivityRow._fields
 """
-The selector for the cancel backend action.
+The column field names. This maps column index (:class:`int`) to field name
+(:class:`str`).
 """
 
-_ACTION_CONNECT = ObjectSel(QAction, "action_Connect")
+_COLUMN_TITLES: Tuple[str, ...] = tuple(
+	ACTIVITY_HEADER.get(__field, __field) for __field in _COLUMN_FIELDS
+)
 """
-The selector for the connect action.
+The column titles. This maps column index (:class:`int`) to column title
+(:class:`str`).
 """
 
-_ACTION_DISCONNECT = ObjectSel(QAction, "action_Disconnect")
+_DISPLAY_ROLE = int(Qt.DisplayRole)
 """
-The selector for the disconnect action.
+The display role value. This is hoisted out of the table model methods called
+for every cell.
 """
 
-_ACTION_KILL_BACKEND = ObjectSel(QAction, "action_KillBackend")
+_HORIZONTAL = Qt.Horizontal
 """
-The selector for the kill backend action.
-"""
-
-_ACTION_REFRESH = ObjectSel(QAction, "action_Refresh")
-"""
-The selector for the refresh action.
+The horizontal orientation. This is hoisted out of the table model methods.
 """
 
 LOG = logging.getLogger(__name__)
@@ -76,46 +80,50 @@ LOG = logging.getLogger(__name__)
 The module logger.
 """
 
-_TAB_WIDTH = 4
+_QUERY_UPDATE_DELAY = 0.05
 """
-The tab width (in spaces).
+The delay (in seconds) before updating the query text. This coalesces rapid
+selection changes into a single query fetch.
 """
 
-_WIDGET_ACTIVITY_TABLE = ObjectSel(QTableView, "tableView_Activity")
+_ROW_PADDING = 4
 """
-The selector for the activity table widget.
+The vertical padding (in pixels) of the activity table rows.
 """
 
-_WIDGET_QUERY_TEXT = ObjectSel(QTextEdit, "textEdit_Query")
+_TAB_WIDTH = 4
 """
-The selector for the query text widget.
+The tab width (in spaces).
 """
 
-_WIDGET_STATUS_BAR = ObjectSel(QStatusBar, "statusbar")
+_TIMESTAMP_FIELDS = frozenset([
+	'backend_start',
+	'query_start',
+	'state_change',
+	'xact_start',
+])
 """
-The selector for the status bar widget.
+The activity fields holding timestamps which need to be formatted for display.
 """
 
-_WINDOW_UI_FILE = "activity.ui"
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S %z"
 """
-The path to the activity window UI file.
+The display format for timestamps.
 """
 
-_MENU_CONNECTED_ACTIONS = [
-	_ACTION_DISCONNECT,
-	_ACTION_REFRESH,
-]
-"""
-The selectors for the menu actions that require an active connection.
-"""
 
-_MENU_SELECTED_BACKEND_ACTIONS = [
-	_ACTION_CANCEL_BACKEND,
-	_ACTION_KILL_BACKEND,
-]
-"""
-The selectors for the menu actions that require a specific backend to be selected.
-"""
+def _format_datum(value: Any) -> Any:
+	"""
+	Format the activity datum for display.
+
+	*value* (:class:`object`) is the datum.
+
+	Returns the display datum.
+	"""
+	if isinstance(value, datetime.datetime):
+		return value.strftime(_TIMESTAMP_FORMAT)
+
+	return value
 
 
 class ActivityController(object):
@@ -123,6 +131,34 @@ class ActivityController(object):
 	The :class:`ActivityController` class manages the activity window.
 	"""
 
+	__slots__ = (
+		'__activity_model',
+		'__activity_table',
+		'__base_title',
+		'__column_lengths',
+		'__connect_dialog',
+		'__connected_actions',
+		'__pg_activity',
+		'__populated_activity',
+		'__query_text',
+		'__query_update_pid',
+		'__query_update_task',
+		'__query_update_timer',
+		'__quit_future',
+		'__refresh_event',
+		'__refresh_interval',
+		'__refresh_skipped',
+		'__refresh_task',
+		'__row_limit',
+		'__selected_backend_actions',
+		'__status_bar',
+		'__ui',
+		'__window',
+		# NOTICE: Qt signal connections to bound methods hold weak references to
+		# the controller.
+		'__weakref__',
+	)
+
 	def __init__(self) -> None:
 		"""
 		Initializes the :class:`ActivityController` instance.
@@ -133,11 +169,6 @@ class ActivityController(object):
 		*__activity_model* (:class:`ActivityTableModel`) is the table model.
 		"""
 
-		self.__activity_proxy_model = cast(QSortFilterProxyModel, None)
-		"""
-		*__activity_proxy_model* (:class:`QSortFilterProxyModel`) is the sort proxy model.
-		"""
-
 		self.__activity_table = cast(QTableView, None)
 		"""
 		*__activity_table* (:class:`QTableView`) is the activity table widget.
@@ -148,17 +179,60 @@ class ActivityController(object):
 		*base_title* (:class:`str`) is the base window title.
 		"""
 
+		self.__column_lengths: List[int] = []
+		"""
+		*__column_lengths* (:class:`list` of :class:`int`) maps column index
+		(:class:`int`) to the longest display length (:class:`int`) the column was
+		last sized for.
+		"""
+
+		self.__connect_dialog = ConnectDialogController()
+		"""
+		*__connect_dialog* (:class:`ConnectDialogController`) is the connect dialog.
+		This is reused so the dialog is only created once.
+		"""
+
+		self.__connected_actions: List[QAction] = []
+		"""
+		*__connected_actions* (:class:`list` of :class:`QAction`) contains the menu
+		actions that require an active connection.
+		"""
+
 		self.__pg_activity: Optional[PostgresActivityManager] = None
 		"""
 		*__pg_activity* (:class:`PostgresActivityManager`) is used to monitor the
 		activity of the PostgreSQL database.
 		"""
 
+		self.__populated_activity: List[ActivityRow] = []
+		"""
+		*__populated_activity* (:class:`list` of :class:`ActivityRow`) is the
+		activity data the table was last populated with.
+		"""
+
 		self.__query_text = cast(QTextEdit, None)
 		"""
 		*__query_text* (:class:`QTextEdit`) is the query text widget.
 		"""
 
+		self.__query_update_pid: Optional[int] = None
+		"""
+		*__query_update_pid* (:class:`int` or :data:`None`) is the PID of the
+		backend process whose query text will be fetched by the next query update.
+		"""
+
+		self.__query_update_task: Optional[asyncio.Task] = None
+		"""
+		*__query_update_task* (:class:`asyncio.Task` or :data:`None`) is the
+		active query update task.
+		"""
+
+		self.__query_update_timer: Optional[asyncio.TimerHandle] = None
+		"""
+		*__query_update_timer* (:class:`asyncio.TimerHandle` or :data:`None`) is
+		the timer to start the next scheduled query update.
+		"""
+
 		self.__quit_future = cast(asyncio.Future, None)
 		"""
 		*__quit_future* (:class:`asyncio.Future`) is the future that will be
@@ -170,16 +244,34 @@ class ActivityController(object):
 		*__refresh_interval* (:class:`float`) is the refresh interval (in seconds).
 		"""
 
+		self.__refresh_skipped = False
+		"""
+		*__refresh_skipped* (:class:`bool`) is whether a refresh was skipped while
+		the window was hidden.
+		"""
+
+		self.__refresh_event = cast(asyncio.Event, None)
+		"""
+		*__refresh_event* (:class:`asyncio.Event`) is set to wake the refresh loop
+		for an immediate refresh.
+		"""
+
 		self.__refresh_task: Optional[asyncio.Task] = None
 		"""
-		*__refresh_task* (:class:`asyncio.Task` or :data:`None`) is the active
-		refresh task.
+		*__refresh_task* (:class:`asyncio.Task` or :data:`None`) is the refresh
+		loop task.
+		"""
+
+		self.__row_limit = 500
+		"""
+		*__row_limit* (:class:`int`) is the maximum number of activity rows to
+		fetch and display.
 		"""
 
-		self.__refresh_timer: Optional[asyncio.TimerHandle] = None
+		self.__selected_backend_actions: List[QAction] = []
 		"""
-		*__refresh_timer* (:class:`asyncio.TimerHandle` or :data:`None`) is the
-		timer to start the next scheduled refresh.
+		*__selected_backend_actions* (:class:`list` of :class:`QAction`) contains
+		the menu actions that require a specific backend to be selected.
 		"""
 
 		self.__status_bar = cast(QStatusBar, None)
@@ -187,11 +279,30 @@ class ActivityController(object):
 		*__status_bar* (:class:`QStatusBar`) is the status bar widget.
 		"""
 
+		self.__ui = cast(Ui_MainWindow, None)
+		"""
+		*__ui* (:class:`Ui_MainWindow`) contains the activity window widgets.
+		"""
+
 		self.__window = cast(QMainWindow, None)
 		"""
 		*window* (:class:`QMainWindow`) is the activity window.
 		"""
 
+	def __cancel_query_update(self) -> None:
+		"""
+		Cancel the scheduled and active query updates.
+		"""
+		timer, self.__query_update_timer = self.__query_update_timer, None
+		if timer is not None:
+			LOG.debug("Query update timer canceled.")
+			timer.cancel()
+
+		task, self.__query_update_task = self.__query_update_task, None
+		if task is not None:
+			LOG.debug("Query update task canceled.")
+			task.cancel()
+
 	def __cancel_refresh_task(self) -> None:
 		"""
 		Cancel the active refresh task.
@@ -201,15 +312,6 @@ class ActivityController(object):
 			LOG.debug("Refresh task canceled.")
 			task.cancel()
 
-	def __cancel_refresh_timer(self) -> None:
-		"""
-		Cancel the active refresh timer.
-		"""
-		timer, self.__refresh_timer = self.__refresh_timer, None
-		if timer is not None:
-			LOG.debug("Refresh timer canceled.")
-			timer.cancel()
-
 	def __clear_query_text(self) -> None:
 		"""
 		Clear the query text.
@@ -221,19 +323,56 @@ class ActivityController(object):
 		Clear the activity table.
 		"""
 		self.__activity_model.set_data([])
+		self.__populated_activity = []
+		self.__status_bar.clearMessage()
+
+	async def __confirm_kill_backends(self, pids: List[int]) -> bool:
+		"""
+		Ask the user to confirm killing the backend processes.
+
+		*pids* (:class:`list` of :class:`int`) contains the PIDs of the backend
+		processes.
+
+		Returns whether killing was confirmed (:class:`bool`).
+		"""
+		pid_list = ", ".join(map(str, sorted(pids)))
+		message_box = QMessageBox(
+			QMessageBox.Question,
+			"Kill Backends",
+			f"Kill the {len(pids)} backend processes: {pid_list}?",
+			QMessageBox.Yes | QMessageBox.No,
+			self.__window,
+		)
+		message_box.setDefaultButton(QMessageBox.No)
+
+		# NOTICE: Open the message box without blocking so that the event loop
+		# keeps running while waiting for the answer.
+		result = asyncio.get_running_loop().create_future()
+		message_box.finished: SignalInstance  # noqa
+		message_box.finished.connect(
+			lambda _code: result.done() or result.set_result(None)
+		)
+		message_box.open()
+		try:
+			await result
+			button = message_box.standardButton(message_box.clickedButton())
+		finally:
+			message_box.deleteLater()
+
+		return button == QMessageBox.Yes
 
 	def __disable_connected_actions(self) -> None:
 		"""
 		Disable the menu actions that require an active connection.
 		"""
-		self.__enable_actions(_MENU_CONNECTED_ACTIONS, False)
+		self.__enable_actions(self.__connected_actions, False)
 
 	def __disable_selected_backend_actions(self) -> None:
 		"""
 		Disable the menu actions that require a specific backend to be selected from
 		the activity table.
 		"""
-		self.__enable_actions(_MENU_SELECTED_BACKEND_ACTIONS, False)
+		self.__enable_actions(self.__selected_backend_actions, False)
 
 	async def __disconnect_pg(self) -> None:
 		"""
@@ -243,65 +382,67 @@ class ActivityController(object):
 		if pg_activity is not None:
 			await pg_activity.close()
 
-	def __enable_actions(
-		self,
-		selectors: List[ObjectSel],
-		enable: bool,
-	) -> None:
+	def __enable_actions(self, actions: List[QAction], enable: bool) -> None:
 		"""
 		Enables or disables the specified actions.
 
-		*selectors* (:class:`list` of :class:`ObjectSel`) contains the selectors for
-		the actions.
+		*actions* (:class:`list` of :class:`QAction`) contains the actions.
 
 		*enable* (:class:`bool`) is whether the action should be enabled
 		(:data:`True`), or disabled (:data:`False`).
 		"""
-		for sel in selectors:
-			action: QAction = self.__get_child(sel)
+		for action in actions:
 			action.setEnabled(enable)
 
-	def __get_child(self, sel: ObjectSel) -> QObject:
-		"""
-		Get the window child object.
-
-		*sel* (:class:`ObjectSel`) is the object selector.
-
-		Returns the child (:class:`QObject`).
-		"""
-		child = find_child(self.__window, sel)
-		assert child is not None, "Failed to find child {type}:{name}.".format(
-			type=sel.type.__name__, name=sel.name,
-		)
-		return child
-
 	def __get_selected_pid(self) -> Optional[int]:
 		"""
 		Get the PID of the selected connection.
 
 		Returns the PID (:class:`int` or :data:`None`).
 		"""
+		# NOTICE: Read the first selection range directly instead of building the
+		# list of selected rows.
 		pid: Optional[int] = None
-		for proxy_index in self.__activity_table.selectionModel().selectedRows():
-			LOG.debug(f"Get PID proxy index: {proxy_index.row()}")
-			source_index = self.__activity_proxy_model.mapToSource(proxy_index)
-			LOG.debug(f"Get PID source index: {source_index.row()}")
-			activity_row = self.__activity_model.get_data()[source_index.row()]
-			pid = activity_row.pid
-			break
-
-		LOG.debug(f"Selected PID: {pid}")
+		selection = self.__activity_table.selectionModel().selection()
+		if not selection.isEmpty():
+			row = selection.first().top()
+			pid = self.__activity_model.get_data()[row].pid
+
+		LOG.debug("Selected PID: %s", pid)
 		return pid
 
+	def __get_selected_pids(self) -> List[int]:
+		"""
+		Get the PIDs of the selected connections.
+
+		Returns the PIDs (:class:`list` of :class:`int`).
+		"""
+		data = self.__activity_model.get_data()
+		pids = {
+			data[__row].pid: None
+			for __range in self.__activity_table.selectionModel().selection()
+			for __row in range(__range.top(), __range.bottom() + 1)
+		}
+		LOG.debug("Selected PIDs: %s", pids)
+		return list(pids)
+
+	def __is_window_hidden(self) -> bool:
+		"""
+		Get whether the activity window cannot be seen.
+
+		Returns whether the window is hidden or minimized (:class:`bool`).
+		"""
+		return not self.__window.isVisible() or self.__window.isMinimized()
+
 	@asyncSlot()
 	async def __on_action_cancel_backend(self) -> None:
 		"""
 		Called when the cancel backend action is triggered.
 		"""
 		LOG.debug("Cancel backend action.")
-		pid = self.__get_selected_pid()
-		if pid is not None:
-			await self.__pg_activity.cancel_backend(pid)
+		pids = self.__get_selected_pids()
+		if pids:
+			await self.__pg_activity.cancel_backends(pids)
 
 	@asyncSlot()
 	async def __on_action_connect(self) -> None:
@@ -311,20 +452,13 @@ class ActivityController(object):
 		LOG.debug("Connect action.")
 
 		# Open connect dialog.
-		dialog = ConnectDialogController()
-		data = await dialog.open(self.__window)
+		data = await self.__connect_dialog.open(self.__window)
 
 		if data is not None:
 			LOG.debug("Connect dialog accepted.")
 
 			# Disconnect active connection.
-			self.__disable_connected_actions()
-			self.__disable_selected_backend_actions()
-			self.__stop_refresh()
-			self.__clear_table()
-			self.__clear_query_text()
-			self.__set_title()
-			await self.__disconnect_pg()
+			await self.__reset_session()
 
 			# Establish new connection.
 			self.__pg_activity = PostgresActivityManager(data.params)
@@ -339,8 +473,8 @@ class ActivityController(object):
 				LOG.debug("Connect done.")
 				params = self.__pg_activity.params
 				self.__set_title(f"{params.user}@{params.host}/{params.database}")
-				self.__enable_actions(_MENU_CONNECTED_ACTIONS, True)
-				self.__start_refresh(delay=False)
+				self.__enable_actions(self.__connected_actions, True)
+				self.__start_refresh()
 
 		else:
 			LOG.debug("Connect dialog rejected.")
@@ -353,13 +487,7 @@ class ActivityController(object):
 		LOG.debug("Disconnect action.")
 
 		# Disconnect active connection.
-		self.__disable_connected_actions()
-		self.__disable_selected_backend_actions()
-		self.__stop_refresh()
-		self.__clear_table()
-		self.__clear_query_text()
-		self.__set_title()
-		await self.__disconnect_pg()
+		await self.__reset_session()
 
 	@asyncSlot()
 	async def __on_action_kill_backend(self) -> None:
@@ -367,9 +495,15 @@ class ActivityController(object):
 		Called when the kill backend action is triggered.
 		"""
 		LOG.debug("Kill backend action.")
-		pid = self.__get_selected_pid()
-		if pid is not None:
-			await self.__pg_activity.terminate_backend(pid)
+		pids = self.__get_selected_pids()
+
+		# Confirm before killing more than one backend.
+		if len(pids) > 1 and not await self.__confirm_kill_backends(pids):
+			LOG.debug("Kill backends declined: %s", pids)
+			return
+
+		if pids and self.__pg_activity is not None:
+			await self.__pg_activity.terminate_backends(pids)
 
 	@asyncSlot()
 	async def __on_action_refresh(self) -> None:
@@ -377,10 +511,9 @@ class ActivityController(object):
 		Called when the refresh action is triggered.
 		"""
 		LOG.debug("Refresh action.")
-		self.__start_refresh(delay=False)
+		self.__start_refresh()
 
-	@asyncSlot()
-	async def __on_activity_selection_changed(
+	def __on_activity_selection_changed(
 		self,
 		selected: QItemSelection,
 		deselected: QItemSelection,
@@ -392,14 +525,15 @@ class ActivityController(object):
 
 		*deselected* (:class:`QItemSelection`) is the previously selected items.
 		"""
-		# NOTICE: On refresh, this is called twice. First, to deselect a "-1" row.
-		# Second, to select the active row.
+		# NOTICE: On refresh, this can be called twice. First, to deselect a "-1"
+		# row. Second, to select the active row. The query update is scheduled so
+		# that these only fetch the query text once.
 		if selected.isEmpty():
 			return
 
 		pid = self.__get_selected_pid()
 
-		LOG.debug(f"Activity selection changed: {pid}.")
+		LOG.debug("Activity selection changed: %s.", pid)
 		#LOG.debug("Activity selection changed: {pid} (S={s}, D={d}).".format(
 		#	pid=pid,
 		#	s=[r for isr in selected.toList() for r in range(isr.top(), isr.bottom() + 1)],
@@ -407,8 +541,8 @@ class ActivityController(object):
 		#))
 
 		if pid is not None:
-			self.__enable_actions(_MENU_SELECTED_BACKEND_ACTIONS, True)
-			await self.__update_query_text(pid)
+			self.__enable_actions(self.__selected_backend_actions, True)
+			self.__start_query_update(pid)
 		else:
 			self.__disable_selected_backend_actions()
 
@@ -427,18 +561,44 @@ class ActivityController(object):
 		LOG.debug("Close.")
 		self.__stop_refresh()
 		await self.__disconnect_pg()
+		await PostgresActivityManager.close_pools()
 
-	def __on_refresh_timer_done(self) -> None:
+	def __on_query_update_timer_done(self) -> None:
 		"""
-		Called when the refresh timer is done.
+		Called when the query update timer is done.
+		"""
+		LOG.debug("Query update timer done.")
+		self.__query_update_timer = None
+
+		# Cancel any outdated query update.
+		task, self.__query_update_task = self.__query_update_task, None
+		if task is not None:
+			task.cancel()
+
+		self.__query_update_task = asyncio.create_task(
+			self.__update_query_text(self.__query_update_pid)
+		)
+
+	def __on_window_state_changed(self, state: Qt.WindowState) -> None:
 		"""
-		LOG.debug("Refresh timer.")
+		Called when the activity window state changes.
 
-		# Clear refresh timer.
-		self.__refresh_timer = None
+		*state* (:class:`Qt.WindowState`) is the new window state.
+		"""
+		LOG.debug("Window state changed: %s.", state)
 
-		# Start refresh task.
-		self.__start_refresh_task()
+		# Refresh the skipped activity when the window is restored.
+		# - NOTICE: The signal is emitted before the widget window state is updated,
+		#   so the widget may still report being minimized. Use the new state
+		#   instead.
+		if (
+			self.__refresh_skipped
+			and self.__pg_activity is not None
+			and self.__window.isVisible()
+			and not state & Qt.WindowMinimized
+		):
+			self.__refresh_skipped = False
+			self.__start_refresh()
 
 	async def run(self) -> int:
 		"""
@@ -449,34 +609,42 @@ class ActivityController(object):
 		LOG.debug("Create window.")
 
 		# Create window.
-		with importlib.resources.path(app.gui, _WINDOW_UI_FILE) as ui_file:
-			ui_result = QUiLoader().load(ui_file)
-
-		assert isinstance(ui_result, QMainWindow), ui_result
-		self.__window = ui_result
+		# - NOTICE: The window is set up by the UI class compiled from
+		#   "activity.ui" instead of parsing the UI file at runtime.
+		self.__window = QMainWindow()
+		self.__ui = Ui_MainWindow()
+		self.__ui.setupUi(self.__window)
 		self.__base_title = self.__window.windowTitle()
 
+		ui = self.__ui
+
 		# Bind actions.
-		action_sel: ObjectSel
-		for action_sel, callback in [
-			(_ACTION_CANCEL_BACKEND, self.__on_action_cancel_backend),
-			(_ACTION_CONNECT, self.__on_action_connect),
-			(_ACTION_DISCONNECT, self.__on_action_disconnect),
-			(_ACTION_KILL_BACKEND, self.__on_action_kill_backend),
-			(_ACTION_REFRESH, self.__on_action_refresh),
+		for action, callback in [
+			(ui.action_CancelBackend, self.__on_action_cancel_backend),
+			(ui.action_Connect, self.__on_action_connect),
+			(ui.action_Disconnect, self.__on_action_disconnect),
+			(ui.action_KillBackend, self.__on_action_kill_backend),
+			(ui.action_Refresh, self.__on_action_refresh),
 		]:
-			action: QAction = self.__get_child(action_sel)
 			action.triggered: SignalInstance  # noqa
 			action.triggered.connect(callback)
 
 		# Initialize actions.
+		self.__connected_actions = [
+			ui.action_Disconnect,
+			ui.action_Refresh,
+		]
+		self.__selected_backend_actions = [
+			ui.action_CancelBackend,
+			ui.action_KillBackend,
+		]
 		self.__disable_connected_actions()
 		self.__disable_selected_backend_actions()
 
 		# Get widgets.
-		self.__activity_table: QTableView = self.__get_child(_WIDGET_ACTIVITY_TABLE)
-		self.__status_bar = self.__get_child(_WIDGET_STATUS_BAR)
-		self.__query_text: QTextEdit = self.__get_child(_WIDGET_QUERY_TEXT)
+		self.__activity_table = ui.tableView_Activity
+		self.__status_bar = ui.statusbar
+		self.__query_text = ui.textEdit_Query
 
 		# Setup query text.
 		font_metrics = self.__query_text.fontMetrics()
@@ -487,12 +655,23 @@ class ActivityController(object):
 		self.__activity_model = ActivityTableModel(self.__activity_table)
 		pid_column = self.__activity_model.get_fields().index("pid")
 
-		self.__activity_proxy_model = QSortFilterProxyModel(self.__activity_table)
-		self.__activity_proxy_model.setDynamicSortFilter(True)
-		self.__activity_proxy_model.setSourceModel(self.__activity_model)
-
-		self.__activity_table.setModel(self.__activity_proxy_model)
+		self.__activity_table.setModel(self.__activity_model)
 		self.__activity_table.sortByColumn(pid_column, Qt.AscendingOrder)
+		self.__activity_table.resizeColumnsToContents()
+		self.__column_lengths = [0] * len(self.__activity_model.get_fields())
+
+		# Setup row header.
+		# - NOTICE: Use a fixed row height so painting does not need to query the
+		#   height of each row.
+		# - NOTICE: The row numbers are not meaningful so the row header is hidden
+		#   to avoid querying its header data on every scroll.
+		# - NOTICE: The rows only contain single lines of text so the row height is
+		#   set from the font.
+		vert_header = self.__activity_table.verticalHeader()
+		vert_header.setSectionResizeMode(QHeaderView.Fixed)
+		font_metrics = self.__activity_table.fontMetrics()
+		vert_header.setDefaultSectionSize(font_metrics.height() + _ROW_PADDING)
+		vert_header.setVisible(False)
 
 		sel_model = self.__activity_table.selectionModel()
 		sel_model.selectionChanged: SignalInstance  # noqa
@@ -501,6 +680,10 @@ class ActivityController(object):
 		# Display window.
 		self.__window.show()
 
+		window_handle = self.__window.windowHandle()
+		window_handle.windowStateChanged: SignalInstance  # noqa
+		window_handle.windowStateChanged.connect(self.__on_window_state_changed)
+
 		LOG.debug("Window created.")
 
 		# Wait for application to close.
@@ -524,52 +707,163 @@ class ActivityController(object):
 
 		*data* (:class:`list` of :class:`ActivityRow`) is the activity data.
 		"""
-		LOG.debug(f"Populate table: {len(data)} rows.")
+		LOG.debug("Populate table: %s rows.", len(data))
 
-		# Get PID for the selected row.
-		pid = self.__get_selected_pid()
+		# Skip repopulating the table when the activity has not changed (e.g., on
+		# an idle server).
+		if data == self.__populated_activity:
+			LOG.debug("Activity unchanged.")
+			return
 
-		# Update activity data.
-		self.__activity_model.set_data(data)
-		self.__activity_table.resizeColumnsToContents()
+		self.__populated_activity = data
 
-		# Reselect the row with the PID.
-		if pid is not None:
-			for i, activity_row in enumerate(data):
-				if pid == activity_row.pid:
-					source_index = self.__activity_model.index(i, 0)
-					LOG.debug(f"New source index: {source_index.row()}")
-					proxy_index = self.__activity_proxy_model.mapFromSource(source_index)
-					LOG.debug(f"New proxy index: {proxy_index.row()}")
-					self.__activity_table.selectRow(proxy_index.row())
-					break
+		# Get PIDs for the selected rows.
+		pids = self.__get_selected_pids()
+
+		# Update activity data.
+		# - NOTICE: Disable updates on the table while the data is changed so it is
+		#   repainted once afterward instead of for each model signal.
+		# - NOTICE: Block the selection signals while the data is changed and the
+		#   rows are reselected so the selection handler is not called for each
+		#   intermediate selection.
+		table = self.__activity_table
+		sel_model = table.selectionModel()
+		table.setUpdatesEnabled(False)
+		try:
+			with QSignalBlocker(sel_model):
+				self.__activity_model.set_data(data)
+				if pids:
+					self.__select_pids(pids)
+
+			self.__resize_columns()
+
+		finally:
+			table.setUpdatesEnabled(True)
+			table.viewport().update()
+
+		# Update the selected backend actions and query text.
+		if pids:
+			pid = self.__get_selected_pid()
+			if pid is not None:
+				self.__start_query_update(pid)
+			else:
+				self.__disable_selected_backend_actions()
 
-	async def __refresh_activity(self) -> None:
+	async def __refresh_activity(self) -> Optional[ActivityResult]:
 		"""
-		Refresh the PostgreSQL activity.
+		Fetch the PostgreSQL activity.
+
+		Returns the activity result (:class:`ActivityResult`), or :data:`None` if
+		the fetch failed.
 		"""
-		# Refresh activity.
 		LOG.debug("Refresh activity.")
 		try:
-			results = await self.__pg_activity.fetch_activity()
+			result = await self.__pg_activity.fetch_activity(limit=self.__row_limit)
 
 		except Exception:
 			LOG.exception("Refresh error.")
+			return None
 
-			# Clear refresh state.
-			self.__refresh_task = None
+		LOG.debug(
+			"Refresh done: %s of %s rows.", len(result.activity), result.total,
+		)
+		return result
 
-		else:
-			LOG.debug(f"Refresh done: {len(results)} rows.")
+	async def __refresh_loop(self) -> None:
+		"""
+		Refresh the PostgreSQL activity until canceled.
+		"""
+		loop = asyncio.get_running_loop()
+		event = self.__refresh_event
+		while True:
+			# NOTICE: Clear the event before fetching so that a refresh requested
+			# during the fetch is not lost.
+			event.clear()
 
-			# Clear refresh state.
-			self.__refresh_task = None
+			# NOTICE: The next refresh is timed from when the fetch starts so that the
+			# refresh interval does not drift by the time spent fetching and
+			# rendering.
+			next_time = loop.time() + self.__refresh_interval
 
-			# Populate activity table.
-			self.__populate_table(results)
+			# Skip the refresh while the window cannot be seen. It is refreshed as
+			# soon as it is restored.
+			if self.__is_window_hidden():
+				LOG.debug("Refresh skipped.")
+				self.__refresh_skipped = True
+
+			else:
+				self.__refresh_skipped = False
+				result = await self.__refresh_activity()
+
+				# Populate activity table.
+				if result is not None:
+					self.__populate_table(result.activity)
+					self.__show_row_count(len(result.activity), result.total)
+
+			# Wait for the next refresh.
+			try:
+				await asyncio.wait_for(event.wait(), next_time - loop.time())
+			except asyncio.TimeoutError:
+				pass
+
+	async def __reset_session(self) -> None:
+		"""
+		Disconnect the active connection, and reset the activity window.
+		"""
+		self.__disable_connected_actions()
+		self.__disable_selected_backend_actions()
+		self.__stop_refresh()
+
+		# NOTICE: Disable updates on the window while it is reset so it is
+		# repainted once afterward instead of for each cleared widget.
+		self.__window.setUpdatesEnabled(False)
+		try:
+			self.__clear_table()
+			self.__clear_query_text()
+			self.__set_title()
+		finally:
+			self.__window.setUpdatesEnabled(True)
+
+		await self.__disconnect_pg()
+
+	def __resize_columns(self) -> None:
+		"""
+		Resize the activity table columns whose contents grew since they were last
+		sized. Sizing a column to its contents queries every row, so the columns
+		are not resized on every refresh.
+		"""
+		column_lengths = self.__column_lengths
+		for column, length in enumerate(self.__activity_model.get_column_lengths()):
+			if length > column_lengths[column]:
+				self.__activity_table.resizeColumnToContents(column)
+				column_lengths[column] = length
+
+	def __select_pids(self, pids: List[int]) -> None:
+		"""
+		Select the activity table rows for the backend processes. Any other rows are
+		deselected.
+
+		*pids* (:class:`list` of :class:`int`) contains the PIDs of the backend
+		processes.
+		"""
+		model = self.__activity_model
+		rows = [
+			__row for __row in map(model.get_row_for_pid, pids) if __row is not None
+		]
 
-			# Schedule next refresh.
-			self.__start_refresh(delay=True)
+		last_column = len(model.get_fields()) - 1
+		selection = QItemSelection()
+		for row in rows:
+			selection.select(model.index(row, 0), model.index(row, last_column))
+
+		sel_model = self.__activity_table.selectionModel()
+		sel_model.select(
+			selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows,
+		)
+		if rows:
+			sel_model.setCurrentIndex(
+				model.index(rows[0], 0), QItemSelectionModel.NoUpdate,
+			)
 
 	def __set_title(self, prefix: Optional[str] = None) -> None:
 		"""
@@ -578,57 +872,56 @@ class ActivityController(object):
 		*prefix* (:class:`str` or :data:`None`) is the title prefix.
 		"""
 		# Build title.
-		title_parts = [prefix, self.__base_title]
-		title = " - ".join(filter(None, title_parts))
+		if prefix:
+			title = f"{prefix} - {self.__base_title}"
+		else:
+			title = self.__base_title
 
 		# Set title.
 		self.__window.setWindowTitle(title)
 
-	def __start_refresh(self, delay: bool) -> None:
+	def __start_refresh(self) -> None:
 		"""
-		Start monitoring the activity of PostgreSQL.
-
-		*delay* (:class:`bool`) is whether to delay the next refresh.
+		Start monitoring the activity of PostgreSQL. If it is already being
+		monitored, refresh immediately.
 		"""
 		if self.__refresh_task is not None:
-			LOG.debug("Refresh in progress.")
+			LOG.debug("Refresh now.")
+			self.__refresh_event.set()
 			return
 
-		if delay:
-			# Start refresh timer.
-			self.__start_refresh_timer()
+		LOG.debug("Start refresh.")
+		self.__refresh_event = asyncio.Event()
+		self.__refresh_task = asyncio.create_task(self.__refresh_loop())
 
-		else:
-			# Cancel any active timer.
-			self.__cancel_refresh_timer()
+	def __show_row_count(self, count: int, total: int) -> None:
+		"""
+		Show the number of activity rows in the status bar.
 
-			# Start refresh task.
-			self.__start_refresh_task()
+		*count* (:class:`int`) is the number of rows displayed.
 
-	def __start_refresh_task(self) -> None:
+		*total* (:class:`int`) is the number of rows in PostgreSQL.
 		"""
-		Start the refresh task.
-		"""
-		if self.__refresh_task is not None:
-			LOG.debug("Refresh in progress.")
-			return
-
-		self.__refresh_task = asyncio.create_task(self.__refresh_activity())
+		if count < total:
+			self.__status_bar.showMessage(f"Showing {count} of {total} backends.")
+		else:
+			self.__status_bar.showMessage(f"Showing {count} backends.")
 
-	def __start_refresh_timer(self) -> None:
+	def __start_query_update(self, pid: int) -> None:
 		"""
-		Start the refresh timer to start the next scheduled refresh.
+		Schedule updating the query text.
+
+		*pid* (:class:`int`) is the PID of the backend process.
 		"""
-		if self.__refresh_timer is not None:
-			# Refresh already scheduled, do nothing.
-			LOG.debug("Refresh is scheduled.")
+		self.__query_update_pid = pid
+		if self.__query_update_timer is not None:
+			# Query update already scheduled, it will use the latest PID.
+			LOG.debug("Query update is scheduled.")
 
 		else:
-			# Schedule next refresh.
-			LOG.debug("Schedule refresh.")
-			self.__refresh_timer = asyncio.get_running_loop().call_later(
-				self.__refresh_interval,
-				self.__on_refresh_timer_done,
+			self.__query_update_timer = asyncio.get_running_loop().call_later(
+				_QUERY_UPDATE_DELAY,
+				self.__on_query_update_timer_done,
 			)
 
 	def __stop_refresh(self) -> None:
@@ -636,8 +929,9 @@ class ActivityController(object):
 		Stop monitoring the activity of PostgreSQL.
 		"""
 		LOG.debug("Stop refresh.")
-		self.__cancel_refresh_timer()
 		self.__cancel_refresh_task()
+		self.__refresh_skipped = False
+		self.__cancel_query_update()
 
 	async def __update_query_text(self, pid: int) -> None:
 		"""
@@ -646,14 +940,26 @@ class ActivityController(object):
 		*pid* (:class:`int`) is the PID of the backend process.
 		"""
 		# Get query text.
-		query = await self.__pg_activity.fetch_query(pid)
-		if query is None:
-			query = ""
+		try:
+			query = await self.__pg_activity.fetch_query(pid)
 
-		# Set query text.
-		if query != self.__query_text.toPlainText():
-			LOG.debug("Set query text.")
-			self.__query_text.setPlainText(query)
+		except Exception:
+			LOG.exception("Query update error.")
+
+			# Clear query update state.
+			self.__query_update_task = None
+
+		else:
+			# Clear query update state.
+			self.__query_update_task = None
+
+			if query is None:
+				query = ""
+
+			# Set query text.
+			if query != self.__query_text.toPlainText():
+				LOG.debug("Set query text.")
+				self.__query_text.setPlainText(query)
 
 
 # noinspection PyMethodOverriding
@@ -663,6 +969,19 @@ class ActivityTableModel(QAbstractTableModel):
 	PostgreSQL activity data.
 	"""
 
+	__slots__ = (
+		'__column_fields',
+		'__column_lengths',
+		'__column_titles',
+		'__columns',
+		'__data',
+		'__pid_column',
+		'__pid_rows',
+		'__sort_column',
+		'__sort_order',
+		'__timestamp_columns',
+	)
+
 	def __init__(self, parent: QObject) -> None:
 		"""
 		Initializes the :class:`ActivityTableModel` instance.
@@ -671,19 +990,30 @@ class ActivityTableModel(QAbstractTableModel):
 		"""
 		super().__init__(parent)
 
-		self.__column_fields: List[str] = list(ActivityRow._fields)
+		self.__column_fields = _COLUMN_FIELDS
 		"""
-		*__column_fields* (:class:`list`) maps column index (:class:`int`) to column
-		field name (:class:`str`).
+		*__column_fields* (:class:`tuple`) maps column index (:class:`int`) to
+		column field name (:class:`str`).
 		"""
 
-		self.__column_titles: List[str] = [
-			ACTIVITY_HEADER.get(__field, __field)
-			for __field in ActivityRow._fields
-		]
+		self.__column_lengths: List[int] = [0 for _ in self.__column_fields]
 		"""
-		*__column_titles* (:class:`list`) maps column index (:class:`int`) to column
-		title (:class:`str`).
+		*__column_lengths* (:class:`list` of :class:`int`) maps column index
+		(:class:`int`) to the longest display length (:class:`int`) in the column.
+		"""
+
+		self.__column_titles = _COLUMN_TITLES
+		"""
+		*__column_titles* (:class:`tuple`) maps column index (:class:`int`) to
+		column title (:class:`str`).
+		"""
+
+		self.__columns: List[Tuple[Any, ...]] = [() for _ in self.__column_fields]
+		"""
+		*__columns* (:class:`list` of :class:`tuple`) is the display data stored by
+		column. This maps column index (:class:`int`) to the column display values
+		(:class:`tuple`) indexed by row. Timestamps are formatted once when the data
+		is set instead of on every repaint.
 		"""
 
 		self.__data: List[ActivityRow] = []
@@ -691,6 +1021,38 @@ class ActivityTableModel(QAbstractTableModel):
 		*__data* (:class:`list` of :class:`ActivityRow`) is the activity data.
 		"""
 
+		self.__pid_column = self.__column_fields.index('pid')
+		"""
+		*__pid_column* (:class:`int`) is the index of the PID column.
+		"""
+
+		self.__pid_rows: Dict[int, int] = {}
+		"""
+		*__pid_rows* (:class:`dict`) maps backend PID (:class:`int`) to row index
+		(:class:`int`).
+		"""
+
+		self.__sort_column = -1
+		"""
+		*__sort_column* (:class:`int`) is the index of the column to sort by. This
+		is ``-1`` when the data is not sorted.
+		"""
+
+		self.__sort_order = Qt.AscendingOrder
+		"""
+		*__sort_order* (:class:`Qt.SortOrder`) is the sort order.
+		"""
+
+		self.__timestamp_columns: AbstractSet[int] = frozenset(
+			__column
+			for __column, __field in enumerate(self.__column_fields)
+			if __field in _TIMESTAMP_FIELDS
+		)
+		"""
+		*__timestamp_columns* (:class:`frozenset` of :class:`int`) contains the
+		indices of the timestamp columns. Only these columns need formatting.
+		"""
+
 	def columnCount(self, index: QModelIndex) -> int:
 		"""
 		Get the number of columns.
@@ -711,15 +1073,10 @@ class ActivityTableModel(QAbstractTableModel):
 
 		Returns the datum for the index.
 		"""
-		#if not index.isValid():
-		#	return None
-
-		if role == Qt.DisplayRole:
-			value = self.__data[index.row()][index.column()]
-			if isinstance(value, datetime.datetime):
-				return value.strftime("%Y-%m-%d %H:%M:%S %z")
+		if role != _DISPLAY_ROLE:
+			return None
 
-			return value
+		return self.__columns[index.column()][index.row()]
 
 	def get_data(self) -> List[ActivityRow]:
 		"""
@@ -729,15 +1086,56 @@ class ActivityTableModel(QAbstractTableModel):
 		"""
 		return self.__data
 
-	def get_fields(self) -> List[str]:
+	def get_column_lengths(self) -> List[int]:
+		"""
+		Get the longest display lengths of the columns.
+
+		Returns the lengths (:class:`list` of :class:`int`) which maps column index
+		(:class:`int`) to the longest display length (:class:`int`).
+		"""
+		return self.__column_lengths
+
+	def get_fields(self) -> Tuple[str, ...]:
 		"""
 		Get the column field names.
 
-		Returns the field names (:class:`list`) which maps column index
+		Returns the field names (:class:`tuple`) which maps column index
 		(:class:`int`) to field name (:class:`str`).
 		"""
 		return self.__column_fields
 
+	def get_row_for_pid(self, pid: int) -> Optional[int]:
+		"""
+		Get the row for the backend process.
+
+		*pid* (:class:`int`) is the PID of the backend process.
+
+		Returns the row index (:class:`int`), or :data:`None` if the backend is not
+		in the data.
+		"""
+		return self.__pid_rows.get(pid)
+
+	def __get_sort_key(self) -> Optional[Callable[[ActivityRow], Any]]:
+		"""
+		Get the sort key for the sort column.
+
+		Returns the sort key (:class:`~collections.abc.Callable`), or :data:`None`
+		if the data is not sorted.
+		"""
+		column = self.__sort_column
+		if column < 0:
+			return None
+
+		get_value = operator.itemgetter(column)
+
+		def get_key(row: ActivityRow) -> Tuple[bool, Any]:
+			# NOTICE: Null values cannot be compared with other values so they are
+			# grouped together after (or before when descending) all other values.
+			value = get_value(row)
+			return (value is None, value)
+
+		return get_key
+
 	def headerData(
 		self,
 		column: int,
@@ -755,8 +1153,12 @@ class ActivityTableModel(QAbstractTableModel):
 
 		Returns the datum for the column (:class:`str` or :data:`None`).
 		"""
-		if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-			return self.__column_titles[column]
+		# NOTICE: Most calls are for roles other than display so check the role
+		# first.
+		if role != _DISPLAY_ROLE or orientation != _HORIZONTAL:
+			return None
+
+		return self.__column_titles[column]
 
 	def rowCount(self, index: QModelIndex) -> int:
 		"""
@@ -774,27 +1176,120 @@ class ActivityTableModel(QAbstractTableModel):
 
 		*data* (:class:`list` of :class:`ActivityRow`) is the activity data.
 		"""
-		# Remove all old rows, and emit required signals.
-		self.beginRemoveRows(QModelIndex(), 0, len(self.__data))
-		self.__data = []
-		self.endRemoveRows()
+		data = self.__sort_rows(data)
+		old_data = self.__data
+		old_count = len(old_data)
+		new_count = len(data)
+
+		# Resize the rows in place, and emit required signals. Only the rows
+		# added or removed are structural changes, so the view keeps its
+		# selection and scroll position.
+		if new_count > old_count:
+			self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+			self.__set_data(data)
+			self.endInsertRows()
+		elif new_count < old_count:
+			self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+			self.__set_data(data)
+			self.endRemoveRows()
+		else:
+			self.__set_data(data)
 
-		# Insert new rows, and emit required signals.
-		self.beginInsertRows(QModelIndex(), 0, len(data))
-		self.__data = data
-		self.endInsertRows()
+		# Notify the view of the span of surviving cells that changed.
+		changed_rows = [
+			__row
+			for __row, (__old, __new) in enumerate(zip(old_data, data))
+			if __old != __new
+		]
+		if changed_rows:
+			changed_columns = {
+				__column
+				for __row in changed_rows
+				for __column, __value in enumerate(data[__row])
+				if __value != old_data[__row][__column]
+			}
+			self.dataChanged.emit(
+				self.index(changed_rows[0], min(changed_columns)),
+				self.index(changed_rows[-1], max(changed_columns)),
+				[Qt.DisplayRole],
+			)
 
+	def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+		"""
+		Sort the activity data.
 
-class SortProxyModel(QSortFilterProxyModel):
-	"""
-	The :class:`SortProxyModel` class provides sorting over the underlying table
-	model.
-	"""
+		*column* (:class:`int`) is the index of the column to sort by.
 
-	def __init__(self, parent: QObject) -> None:
+		*order* (:class:`Qt.SortOrder`) is the sort order.
 		"""
-		Initializes the :class:`ActivityTableModel` instance.
+		self.__sort_column = column
+		self.__sort_order = order
 
-		*parent* (:class:`QObject`) is the parent.
+		self.layoutAboutToBeChanged.emit()
+
+		# Sort the rows, and move the persistent indices (e.g., the selection) with
+		# their rows.
+		old_data = self.__data
+		old_rows = list(range(len(old_data)))
+		key = self.__get_sort_key()
+		if key is not None:
+			old_rows.sort(
+				key=lambda __row: key(old_data[__row]),
+				reverse=order == Qt.DescendingOrder,
+			)
+
+		new_rows = [0] * len(old_rows)
+		for new_row, old_row in enumerate(old_rows):
+			new_rows[old_row] = new_row
+
+		self.__set_data([old_data[__row] for __row in old_rows])
+
+		old_indices = self.persistentIndexList()
+		new_indices = [
+			self.index(new_rows[__index.row()], __index.column())
+			for __index in old_indices
+		]
+		self.changePersistentIndexList(old_indices, new_indices)
+
+		self.layoutChanged.emit()
+
+	def __set_data(self, data: List[ActivityRow]) -> None:
 		"""
-		super().__init__(parent)
+		Store the activity data and its display values.
+
+		*data* (:class:`list` of :class:`ActivityRow`) is the activity data.
+		"""
+		self.__data = data
+		if data:
+			timestamp_columns = self.__timestamp_columns
+			self.__columns = [
+				tuple(map(_format_datum, __values))
+				if __column in timestamp_columns else __values
+				for __column, __values in enumerate(zip(*data))
+			]
+			self.__column_lengths = [
+				max((
+					len(str(__value)) for __value in __values if __value is not None
+				), default=0)
+				for __values in self.__columns
+			]
+		else:
+			self.__columns = [() for _ in self.__column_fields]
+			self.__column_lengths = [0 for _ in self.__column_fields]
+
+		pids = self.__columns[self.__pid_column]
+		self.__pid_rows = dict(zip(pids, range(len(pids))))
+
+	def __sort_rows(self, data: List[ActivityRow]) -> List[ActivityRow]:
+		"""
+		Sort the activity data by the sort column.
+
+		*data* (:class:`list` of :class:`ActivityRow`) is the activity data.
+
+		Returns the sorted activity data (:class:`list` of :class:`ActivityRow`).
+		"""
+		key = self.__get_sort_key()
+		if key is None:
+			return data
+
+		return sorted(data, key=key, reverse=self.__sort_order == Qt.DescendingOrder)
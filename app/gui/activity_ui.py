@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'activity.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QHeaderView, QMainWindow,
+    QMenu, QMenuBar, QSizePolicy, QSplitter,
+    QStatusBar, QTableView, QTextEdit, QVBoxLayout,
+    QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(800, 600)
+        self.action_Connect = QAction(MainWindow)
+        self.action_Connect.setObjectName(u"action_Connect")
+        icon = QIcon()
+        iconThemeName = u"network-connect"
+        if QIcon.hasThemeIcon(iconThemeName):
+            icon = QIcon.fromTheme(iconThemeName)
+        else:
+            icon.addFile(u".", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+
+        self.action_Connect.setIcon(icon)
+        self.action_Disconnect = QAction(MainWindow)
+        self.action_Disconnect.setObjectName(u"action_Disconnect")
+        icon1 = QIcon()
+        iconThemeName = u"network-disconnect"
+        if QIcon.hasThemeIcon(iconThemeName):
+            icon1 = QIcon.fromTheme(iconThemeName)
+        else:
+            icon1.addFile(u".", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+
+        self.action_Disconnect.setIcon(icon1)
+        self.action_Refresh = QAction(MainWindow)
+        self.action_Refresh.setObjectName(u"action_Refresh")
+        icon2 = QIcon()
+        iconThemeName = u"view-refresh"
+        if QIcon.hasThemeIcon(iconThemeName):
+            icon2 = QIcon.fromTheme(iconThemeName)
+        else:
+            icon2.addFile(u".", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+
+        self.action_Refresh.setIcon(icon2)
+        self.action_CancelBackend = QAction(MainWindow)
+        self.action_CancelBackend.setObjectName(u"action_CancelBackend")
+        icon3 = QIcon()
+        iconThemeName = u"media-playback-stop"
+        if QIcon.hasThemeIcon(iconThemeName):
+            icon3 = QIcon.fromTheme(iconThemeName)
+        else:
+            icon3.addFile(u".", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+
+        self.action_CancelBackend.setIcon(icon3)
+        self.action_KillBackend = QAction(MainWindow)
+        self.action_KillBackend.setObjectName(u"action_KillBackend")
+        icon4 = QIcon()
+        iconThemeName = u"process-stop"
+        if QIcon.hasThemeIcon(iconThemeName):
+            icon4 = QIcon.fromTheme(iconThemeName)
+        else:
+            icon4.addFile(u".", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+
+        self.action_KillBackend.setIcon(icon4)
+        self.action_Quit = QAction(MainWindow)
+        self.action_Quit.setObjectName(u"action_Quit")
+        icon5 = QIcon()
+        iconThemeName = u"application-exit"
+        if QIcon.hasThemeIcon(iconThemeName):
+            icon5 = QIcon.fromTheme(iconThemeName)
+        else:
+            icon5.addFile(u".", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+
+        self.action_Quit.setIcon(icon5)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.verticalLayout = QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.splitter = QSplitter(self.centralwidget)
+        self.splitter.setObjectName(u"splitter")
+        self.splitter.setOrientation(Qt.Vertical)
+        self.tableView_Activity = QTableView(self.splitter)
+        self.tableView_Activity.setObjectName(u"tableView_Activity")
+        self.tableView_Activity.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.tableView_Activity.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tableView_Activity.setAlternatingRowColors(True)
+        self.tableView_Activity.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.tableView_Activity.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.tableView_Activity.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.tableView_Activity.setSortingEnabled(True)
+        self.splitter.addWidget(self.tableView_Activity)
+        self.textEdit_Query = QTextEdit(self.splitter)
+        self.textEdit_Query.setObjectName(u"textEdit_Query")
+        font = QFont()
+        font.setFamilies([u"Monospace"])
+        self.textEdit_Query.setFont(font)
+        self.textEdit_Query.setLineWrapMode(QTextEdit.NoWrap)
+        self.textEdit_Query.setAcceptRichText(False)
+        self.splitter.addWidget(self.textEdit_Query)
+
+        self.verticalLayout.addWidget(self.splitter)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 800, 30))
+        self.menu_Server = QMenu(self.menubar)
+        self.menu_Server.setObjectName(u"menu_Server")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.menubar.addAction(self.menu_Server.menuAction())
+        self.menu_Server.addAction(self.action_Connect)
+        self.menu_Server.addSeparator()
+        self.menu_Server.addAction(self.action_Disconnect)
+        self.menu_Server.addAction(self.action_Refresh)
+        self.menu_Server.addAction(self.action_CancelBackend)
+        self.menu_Server.addAction(self.action_KillBackend)
+        self.menu_Server.addSeparator()
+        self.menu_Server.addAction(self.action_Quit)
+
+        self.retranslateUi(MainWindow)
+        self.action_Quit.triggered.connect(MainWindow.close)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"PostgreSQL Activity", None))
+        self.action_Connect.setText(QCoreApplication.translate("MainWindow", u"Co&nnect", None))
+#if QT_CONFIG(shortcut)
+        self.action_Connect.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+N", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_Disconnect.setText(QCoreApplication.translate("MainWindow", u"&Disconnect", None))
+#if QT_CONFIG(shortcut)
+        self.action_Disconnect.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+D", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_Refresh.setText(QCoreApplication.translate("MainWindow", u"&Refresh", None))
+#if QT_CONFIG(shortcut)
+        self.action_Refresh.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+R", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_CancelBackend.setText(QCoreApplication.translate("MainWindow", u"&Cancel Backend", None))
+#if QT_CONFIG(shortcut)
+        self.action_CancelBackend.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+C", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_KillBackend.setText(QCoreApplication.translate("MainWindow", u"&Kill Backend", None))
+#if QT_CONFIG(shortcut)
+        self.action_KillBackend.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+K", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_Quit.setText(QCoreApplication.translate("MainWindow", u"&Quit", None))
+#if QT_CONFIG(shortcut)
+        self.action_Quit.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Q", None))
+#endif // QT_CONFIG(shortcut)
+        self.menu_Server.setTitle(QCoreApplication.translate("MainWindow", u"&Server", None))
+    # retranslateUi
+
@@ -3,7 +3,6 @@ This module defines the connection dialog.
 """
 
 import dataclasses
-import importlib.resources
 import logging
 from typing import (
 	Optional,
@@ -11,86 +10,49 @@ from typing import (
 
 import asyncio
 from PySide6.QtCore import (
-	QObject,
 	SignalInstance)
 from PySide6.QtWidgets import (
 	QDialog,
 	QDialogButtonBox,
 	QLineEdit,
-	QPushButton,
 	QSpinBox,
 	QWidget)
-from PySide6.QtUiTools import (
-	QUiLoader)
 from qasync import (
 	asyncSlot)
 
-import app.gui
 from app.activity import (
 	PostgresConnectionParams)
-from .util import (
-	ObjectSel,
-	find_child)
-
-_DIALOG_UI_FILE = "connect.ui"
-"""
-The path to the activity window UI file.
-"""
-
-_INPUT_DATABASE = ObjectSel(QLineEdit, "lineEdit_Database")
-"""
-The selector for the database input.
-"""
-
-_INPUT_HOST = ObjectSel(QLineEdit, "lineEdit_Host")
-"""
-The selector for the host input.
-"""
-
-_INPUT_PASSWORD = ObjectSel(QLineEdit, "lineEdit_Password")
-"""
-The selector for the password input.
-"""
-
-_INPUT_PORT = ObjectSel(QSpinBox, "spinBox_Port")
-"""
-The selector for the port input.
-"""
-
-_INPUT_USER = ObjectSel(QLineEdit, "lineEdit_User")
-"""
-The selector for the user input.
-"""
+from .connect_ui import (
+	Ui_Dialog)
 
 LOG = logging.getLogger(__name__)
 """
 The module logger.
 """
 
-_WIDGET_BUTTON_BOX = ObjectSel(QDialogButtonBox, "buttonBox")
-"""
-The selector for the dialog button box.
-"""
-
-_WIDGET_CONNECT_BUTTON = ObjectSel(QPushButton, "pushButton_Connect")
-"""
-The selector for the connect button.
-"""
-
 
 class ConnectDialogController(object):
 	"""
 	The :class:`ConnectDialogController` class manages the connection dialog.
 	"""
 
+	__slots__ = (
+		'__dialog',
+		'__result',
+		'__ui',
+		# NOTICE: Qt signal connections to bound methods hold weak references to
+		# the controller.
+		'__weakref__',
+	)
+
 	def __init__(self) -> None:
 		"""
 		Initializes the :class:`ConnectDialogController` instance.
 		"""
 
-		self.__dialog = cast(QDialog, None)
+		self.__dialog: Optional[QDialog] = None
 		"""
-		*__dialog* (:class:`QDialog`) is the connect dialog.
+		*__dialog* (:class:`QDialog` or :data:`None`) is the connect dialog.
 		"""
 
 		self.__result = cast(asyncio.Future[Optional[ConnectDialogData]], None)
@@ -98,19 +60,36 @@ class ConnectDialogController(object):
 		*__result* (:class:`asyncio.Future`) is the future result of the dialog.
 		"""
 
-	def __get_child(self, sel: ObjectSel) -> QObject:
+		self.__ui = cast(Ui_Dialog, None)
+		"""
+		*__ui* (:class:`Ui_Dialog`) contains the connect dialog widgets.
 		"""
-		Get the dialog child object.
 
-		*sel* (:class:`ObjectSel`) is the object selector.
+	def __create_dialog(self, parent: QWidget) -> None:
+		"""
+		Create the connection dialog.
 
-		Returns the child (:class:`QObject`).
+		*parent* (:class:`QWidget`) is the parent widget.
 		"""
-		child = find_child(self.__dialog, sel)
-		assert child is not None, "Failed to find child {type}:{name}.".format(
-			type=sel.type.__name__, name=sel.name,
+		LOG.debug("Create dialog.")
+
+		# Create dialog.
+		# - NOTICE: The dialog is set up by the UI class compiled from "connect.ui"
+		#   instead of parsing the UI file at runtime.
+		self.__dialog = QDialog(parent)
+		self.__ui = Ui_Dialog()
+		self.__ui.setupUi(self.__dialog)
+
+		# Setup connect button.
+		self.__ui.buttonBox.addButton(
+			self.__ui.pushButton_Connect, QDialogButtonBox.ButtonRole.AcceptRole,
 		)
-		return child
+
+		# Bind signals.
+		self.__dialog.accepted: SignalInstance  # noqa
+		self.__dialog.accepted.connect(self.__on_dialog_accepted)
+		self.__dialog.rejected: SignalInstance  # noqa
+		self.__dialog.rejected.connect(self.__on_dialog_rejected)
 
 	@asyncSlot()
 	async def __on_dialog_accepted(self) -> None:
@@ -131,34 +110,19 @@ class ConnectDialogController(object):
 
 	async def open(self, parent: QWidget) -> Optional['ConnectDialogData']:
 		"""
-		Open the connection dialog.
+		Open the connection dialog. The dialog is created the first time it is
+		opened, and reused afterward so it keeps the last entered values.
 
 		*parent* (:class:`QWidget`) is the parent widget.
 
 		Returns the dialog data (:class:`ConnectDialogData`) on success. Otherwise,
 		returns :data:`None`.
 		"""
-		LOG.debug("Create dialog.")
-
-		# Create dialog.
-		with importlib.resources.path(app.gui, _DIALOG_UI_FILE) as ui_file:
-			ui_result = QUiLoader(parent).load(ui_file)
+		if self.__dialog is None:
+			self.__create_dialog(parent)
 
-		assert isinstance(ui_result, QDialog), ui_result
-		self.__dialog = ui_result
 		self.__result = asyncio.get_running_loop().create_future()
 
-		# Setup connect button.
-		connect_button: QPushButton = self.__get_child(_WIDGET_CONNECT_BUTTON)
-		button_box: QDialogButtonBox = self.__get_child(_WIDGET_BUTTON_BOX)
-		button_box.addButton(connect_button, QDialogButtonBox.ButtonRole.AcceptRole)
-
-		# Bind signals.
-		self.__dialog.accepted: SignalInstance  # noqa
-		self.__dialog.accepted.connect(self.__on_dialog_accepted)
-		self.__dialog.rejected: SignalInstance  # noqa
-		self.__dialog.rejected.connect(self.__on_dialog_rejected)
-
 		# Display dialog.
 		self.__dialog.open()
 
@@ -171,11 +135,12 @@ class ConnectDialogController(object):
 		Returns the form data (:class:`ConnectDialogData`).
 		"""
 		# Parse form.
-		database = self.__parse_input_line_edit(_INPUT_DATABASE)
-		host = self.__parse_input_line_edit(_INPUT_HOST)
-		password = self.__parse_input_line_edit(_INPUT_PASSWORD)
-		port = self.__parse_input_spin_box(_INPUT_PORT)
-		user = self.__parse_input_line_edit(_INPUT_USER)
+		ui = self.__ui
+		database = self.__parse_input_line_edit(ui.lineEdit_Database)
+		host = self.__parse_input_line_edit(ui.lineEdit_Host)
+		password = self.__parse_input_line_edit(ui.lineEdit_Password)
+		port = self.__parse_input_spin_box(ui.spinBox_Port)
+		user = self.__parse_input_line_edit(ui.lineEdit_User)
 		params = PostgresConnectionParams(
 			database=database,
 			host=host,
@@ -188,28 +153,24 @@ class ConnectDialogController(object):
 			params=params,
 		)
 
-	def __parse_input_line_edit(self, input_sel: ObjectSel) -> str:
+	def __parse_input_line_edit(self, line_edit: QLineEdit) -> str:
 		"""
 		Parse the line-edit input.
 
-		*input_sel* (:class:`ObjectSel`) is the input selector.
+		*line_edit* (:class:`QLineEdit`) is the input.
 
 		Returns the value (:class:`str` or :data:`None`).
 		"""
-		assert input_sel.type is QLineEdit, input_sel
-		line_edit: QLineEdit = self.__get_child(input_sel)
 		return line_edit.text().strip()
 
-	def __parse_input_spin_box(self, input_sel: ObjectSel) -> int:
+	def __parse_input_spin_box(self, spin_box: QSpinBox) -> int:
 		"""
 		Parse the spin-box input.
 
-		*input_sel* (:class:`ObjectSel`) is the input selector.
+		*spin_box* (:class:`QSpinBox`) is the input.
 
 		Returns the value (:class:`int` or :data:`None`).
 		"""
-		assert input_sel.type is QSpinBox, input_sel
-		spin_box: QSpinBox = self.__get_child(input_sel)
 		return spin_box.value()
 
 
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'connect.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QFormLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpinBox, QVBoxLayout, QWidget)
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        if not Dialog.objectName():
+            Dialog.setObjectName(u"Dialog")
+        Dialog.resize(300, 278)
+        Dialog.setSizeGripEnabled(True)
+        self.verticalLayout = QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.formLayout = QFormLayout()
+        self.formLayout.setObjectName(u"formLayout")
+        self.label_Host = QLabel(Dialog)
+        self.label_Host.setObjectName(u"label_Host")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.LabelRole, self.label_Host)
+
+        self.lineEdit_Host = QLineEdit(Dialog)
+        self.lineEdit_Host.setObjectName(u"lineEdit_Host")
+
+        self.formLayout.setWidget(0, QFormLayout.ItemRole.FieldRole, self.lineEdit_Host)
+
+        self.label_Port = QLabel(Dialog)
+        self.label_Port.setObjectName(u"label_Port")
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.LabelRole, self.label_Port)
+
+        self.spinBox_Port = QSpinBox(Dialog)
+        self.spinBox_Port.setObjectName(u"spinBox_Port")
+        self.spinBox_Port.setMinimum(1)
+        self.spinBox_Port.setMaximum(65535)
+        self.spinBox_Port.setValue(5432)
+
+        self.formLayout.setWidget(1, QFormLayout.ItemRole.FieldRole, self.spinBox_Port)
+
+        self.label_Database = QLabel(Dialog)
+        self.label_Database.setObjectName(u"label_Database")
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.LabelRole, self.label_Database)
+
+        self.lineEdit_Database = QLineEdit(Dialog)
+        self.lineEdit_Database.setObjectName(u"lineEdit_Database")
+
+        self.formLayout.setWidget(2, QFormLayout.ItemRole.FieldRole, self.lineEdit_Database)
+
+        self.label_User = QLabel(Dialog)
+        self.label_User.setObjectName(u"label_User")
+
+        self.formLayout.setWidget(3, QFormLayout.ItemRole.LabelRole, self.label_User)
+
+        self.lineEdit_User = QLineEdit(Dialog)
+        self.lineEdit_User.setObjectName(u"lineEdit_User")
+
+        self.formLayout.setWidget(3, QFormLayout.ItemRole.FieldRole, self.lineEdit_User)
+
+        self.label_Password = QLabel(Dialog)
+        self.label_Password.setObjectName(u"label_Password")
+
+        self.formLayout.setWidget(4, QFormLayout.ItemRole.LabelRole, self.label_Password)
+
+        self.lineEdit_Password = QLineEdit(Dialog)
+        self.lineEdit_Password.setObjectName(u"lineEdit_Password")
+
+        self.formLayout.setWidget(4, QFormLayout.ItemRole.FieldRole, self.lineEdit_Password)
+
+
+        self.verticalLayout.addLayout(self.formLayout)
+
+        self.pushButton_Connect = QPushButton(Dialog)
+        self.pushButton_Connect.setObjectName(u"pushButton_Connect")
+        icon = QIcon(QIcon.fromTheme(u"network-connect"))
+        self.pushButton_Connect.setIcon(icon)
+
+        self.verticalLayout.addWidget(self.pushButton_Connect)
+
+        self.buttonBox = QDialogButtonBox(Dialog)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept)
+        self.buttonBox.rejected.connect(Dialog.reject)
+
+        QMetaObject.connectSlotsByName(Dialog)
+    # setupUi
+
+    def retranslateUi(self, Dialog):
+        Dialog.setWindowTitle(QCoreApplication.translate("Dialog", u"Connect to Server", None))
+        self.label_Host.setText(QCoreApplication.translate("Dialog", u"Host", None))
+        self.label_Port.setText(QCoreApplication.translate("Dialog", u"Port", None))
+        self.label_Database.setText(QCoreApplication.translate("Dialog", u"Database", None))
+        self.lineEdit_Database.setText(QCoreApplication.translate("Dialog", u"postgres", None))
+        self.label_User.setText(QCoreApplication.translate("Dialog", u"User", None))
+        self.lineEdit_User.setText(QCoreApplication.translate("Dialog", u"postgres", None))
+        self.label_Password.setText(QCoreApplication.translate("Dialog", u"Password", None))
+        self.pushButton_Connect.setText(QCoreApplication.translate("Dialog", u"Connect", None))
+    # retranslateUi
+